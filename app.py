@@ -3,6 +3,7 @@ from tkinter import ttk, messagebox
 import csv
 import os
 import datetime
+from operator import attrgetter
 
 # --- Helper Functions (Unchanged) ---
 def time_to_minutes(time_str):
@@ -26,16 +27,20 @@ def is_time_conflict(schedule1, schedule2):
         return s1 < e2 and s2 < e1
     except Exception: return False
 
+# Allowed days and hours (minutes from midnight) for a course.
+_ALLOWED_DAYS = frozenset(('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'))
+_MIN_START = 8 * 60
+_MAX_END = 17 * 60 + 50
+
 def is_within_allowed_time(schedule):
     """Check schedule is Mon-Fri, 08:00-17:50."""
     day, start, end = schedule
-    allowed_days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-    if day not in allowed_days: return False
+    if day not in _ALLOWED_DAYS: return False
     try:
         start_minutes = time_to_minutes(start)
         end_minutes = time_to_minutes(end)
         if start_minutes >= end_minutes: return False # Invalid interval
-        if start_minutes < time_to_minutes("08:00") or end_minutes > time_to_minutes("17:50"): return False
+        if start_minutes < _MIN_START or end_minutes > _MAX_END: return False
         return True
     except Exception: return False
 
@@ -71,8 +76,7 @@ class EnrollmentSystem:
         self.courses_file = os.path.join(self.data_dir, 'courses.csv')
         self.enrollments_file = os.path.join(self.data_dir, 'enrollments.csv')
 
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
 
         self.load_data()
 
@@ -142,8 +146,8 @@ class EnrollmentSystem:
             with open(self.students_file, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
                 writer.writerow(['student_id', 'name'])
-                for student_id in sorted(self.students.keys()):
-                    writer.writerow([self.students[student_id].student_id, self.students[student_id].name])
+                writer.writerows([student.student_id, student.name]
+                                 for student in sorted(self.students.values(), key=attrgetter('student_id')))
         except IOError as e: print(f"Error saving students: {e}")
 
     def save_courses(self):
@@ -151,10 +155,9 @@ class EnrollmentSystem:
             with open(self.courses_file, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
                 writer.writerow(['course_id', 'name', 'instructor', 'day', 'time', 'max_students', 'credits'])
-                for course_id in sorted(self.courses.keys()):
-                    course = self.courses[course_id]
-                    day, start, end = course.schedule
-                    writer.writerow([course.course_id, course.name, course.instructor, day, f"{start}-{end}", course.max_students, course.credits])
+                writer.writerows([course.course_id, course.name, course.instructor, course.schedule[0],
+                                  f"{course.schedule[1]}-{course.schedule[2]}", course.max_students, course.credits]
+                                 for course in sorted(self.courses.values(), key=attrgetter('course_id')))
         except IOError as e: print(f"Error saving courses: {e}")
 
     def save_enrollments(self):
@@ -162,10 +165,10 @@ class EnrollmentSystem:
             with open(self.enrollments_file, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.writer(file)
                 writer.writerow(['student_id', 'course_id'])
-                for student_id in sorted(self.students.keys()):
-                    for course_id in sorted(list(self.students[student_id].registered_courses)):
-                        if course_id in self.courses: # Only save enrollments for existing courses
-                            writer.writerow([student_id, course_id])
+                writer.writerows([student.student_id, course_id]
+                                 for student in sorted(self.students.values(), key=attrgetter('student_id'))
+                                 for course_id in sorted(student.registered_courses)
+                                 if course_id in self.courses) # Only save enrollments for existing courses
         except IOError as e: print(f"Error saving enrollments: {e}")
 
     def add_student(self, student_id, name):
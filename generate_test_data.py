@@ -1,10 +1,49 @@
-import csv
+import argparse
+import io
 import os
 import random
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the random module
+    np = None
+
+try:
+    import liburing
+except ImportError:  # io_uring bindings are optional and Linux-only
+    liburing = None
+
+# Large enough to hold a whole generated file, so nothing reaches the OS
+# until the file is closed.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Fixed seed so every run generates the same enrollments.
+SEED = 0
+
+# Enrollment rows formatted and written per chunk while streaming.
+ENROLLMENT_BATCH_SIZE = 4096
+
+# Rosters at least this large use the Numba sampler when it is installed. It
+# skips the students x courses key matrix the NumPy sampler sorts, saving
+# memory on big rosters; below this size importing Numba costs more time
+# than sampling does.
+NUMBA_MIN_STUDENTS = 1_000_000
+
+parser = argparse.ArgumentParser(description="Generate sample data for the course registration system.")
+parser.add_argument('--archive', action='store_true',
+                    help="write data/data.tar.gz holding all three CSVs instead of separate files")
+parser.add_argument('--scale', type=int, default=1, metavar='N',
+                    help="generate N times the sample student roster (default: 1)")
+args = parser.parse_args()
+if args.scale < 1:
+    parser.error("--scale must be at least 1")
 
 # Create data directory if it doesn't exist
-if not os.path.exists('data'):
-    os.makedirs('data')
+os.makedirs('data', exist_ok=True)
 
 # Sample course data
 courses = [
@@ -41,37 +80,286 @@ students = [
     ('S1010', 'Patricia Thomas'),
 ]
 
-# Generate random enrollments (each student enrolled in 3-5 courses)
-enrollments = []
-for student_id, _ in students:
-    # Randomly select 3-5 courses for each student
-    num_courses = random.randint(3, 5)
-    selected_courses = random.sample([course[0] for course in courses], num_courses)
-    
-    for course_id in selected_courses:
-        enrollments.append((student_id, course_id))
-
-# Save courses to CSV
-with open('data/courses.csv', 'w', newline='') as file:
-    writer = csv.writer(file)
-    writer.writerow(['course_id', 'name', 'instructor', 'day', 'time'])
-    for course in courses:
-        course_id, name, instructor, day, start_time, end_time = course
-        writer.writerow([course_id, name, instructor, day, f"{start_time}-{end_time}"])
-
-# Save students to CSV
-with open('data/students.csv', 'w', newline='') as file:
-    writer = csv.writer(file)
-    writer.writerow(['student_id', 'name'])
-    for student in students:
-        writer.writerow(student)
-
-# Save enrollments to CSV
-with open('data/enrollments.csv', 'w', newline='') as file:
-    writer = csv.writer(file)
-    writer.writerow(['student_id', 'course_id'])
-    for enrollment in enrollments:
-        writer.writerow(enrollment)
-
-print(f"Generated {len(courses)} courses, {len(students)} students, and {len(enrollments)} enrollments.")
-print("Data saved to data/courses.csv, data/students.csv, and data/enrollments.csv") 
\ No newline at end of file
+if args.scale > 1:
+    # Repeat the sample names under fresh IDs continuing from S1001
+    students = [(f"S{1001 + i}", students[i % len(students)][1])
+                for i in range(len(students) * args.scale)]
+
+# The schema is fixed and no field contains a comma, quote or newline, so rows
+# are formatted directly instead of going through csv.writer, encoded once and
+# written to binary files, which also skips the text layer's per-write
+# encoding and newline translation.
+
+# The course and student tables are static, so their files are serialized once,
+# here, and written out verbatim. Each course's start and end are joined into
+# the single 'time' column first so every row is a plain comma join.
+courses_out = [
+    (course_id, name, instructor, day, f"{start_time}-{end_time}")
+    for course_id, name, instructor, day, start_time, end_time in courses
+]
+COURSES_CSV = ("course_id,name,instructor,day,time\n" + "".join(
+    ",".join(course) + "\n" for course in courses_out
+)).encode('utf-8')
+STUDENTS_CSV = ("student_id,name\n" + "".join(
+    f"{student_id},{name}\n" for student_id, name in students
+)).encode('utf-8')
+
+def numba_sampler():
+    """Return the compiled Numba sampler, or None if Numba isn't installed.
+
+    Called only for rosters of NUMBA_MIN_STUDENTS or more, so smaller runs
+    never pay for importing Numba.
+    """
+    try:
+        import numba
+    except ImportError:  # Numba is optional; only used for large rosters
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def sample_courses(num_courses, offsets, n_courses, seeds, out):
+        """Fill out[offsets[i]:offsets[i + 1]] with student i's course indices.
+
+        Each student gets a partial Fisher-Yates shuffle of range(n_courses),
+        driven by its own xorshift64* stream seeded from seeds[i] so rows can
+        be filled in parallel and still reproducibly.
+        """
+        for i in numba.prange(len(num_courses)):
+            pool = np.arange(n_courses)
+            state = np.uint64(seeds[i])
+            for j in range(num_courses[i]):
+                state ^= state >> np.uint64(12)
+                state ^= state << np.uint64(25)
+                state ^= state >> np.uint64(27)
+                r = (state * np.uint64(2685821657736338717)) >> np.uint64(33)
+                swap = j + np.int64(r % np.uint64(n_courses - j))
+                pool[j], pool[swap] = pool[swap], pool[j]
+                out[offsets[i] + j] = pool[j]
+
+    return sample_courses
+
+def generate_enrollments():
+    """Return random enrollments, 3-5 courses per student.
+
+    The result is two parallel columns, student IDs and course IDs, rather
+    than a list of (student_id, course_id) tuples: no per-row tuple objects,
+    and the NumPy path can build both columns as whole arrays.
+    """
+    # Built once rather than per student; neither table changes.
+    student_ids = [student[0] for student in students]
+    course_ids = [course[0] for course in courses]
+    sample_courses = numba_sampler() if np is not None and len(students) >= NUMBA_MIN_STUDENTS else None
+    if sample_courses is not None:
+        rng = np.random.default_rng(SEED)
+        num_courses = rng.integers(3, 6, size=len(students))
+        offsets = np.concatenate(([0], np.cumsum(num_courses)))
+        picked = np.empty(offsets[-1], dtype=np.int64)
+        seeds = rng.integers(1, 2**63 - 1, size=len(students), dtype=np.int64)
+        sample_courses(num_courses, offsets, len(courses), seeds, picked)
+        enroll_sid = np.repeat(np.array(student_ids), num_courses)
+        enroll_cid = np.array(course_ids)[picked]
+    elif np is not None:
+        # Draw every student's sample at once: argsort of a random key matrix
+        # gives each row an independent random ordering of the courses, and
+        # the first 3-5 entries of a row are that student's sample.
+        rng = np.random.default_rng(SEED)
+        num_courses = rng.integers(3, 6, size=len(students))
+        order = np.argsort(rng.random((len(students), len(courses))), axis=1)
+        # Row-major boolean indexing keeps each student's picks together and
+        # in order, lining up with the repeated student IDs.
+        picked = order[np.arange(len(courses)) < num_courses[:, None]]
+        enroll_sid = np.repeat(np.array(student_ids), num_courses)
+        enroll_cid = np.array(course_ids)[picked]
+    else:
+        # A private generator instead of the module-level one: no shared
+        # state with other users of random, and reproducible output.
+        rng = random.Random(SEED)
+        enroll_sid, enroll_cid = [], []
+        for student_id in student_ids:
+            # Randomly select 3-5 courses for each student
+            num_courses = rng.randint(3, 5)
+            selected_courses = rng.sample(course_ids, num_courses)
+
+            for course_id in selected_courses:
+                enroll_sid.append(student_id)
+                enroll_cid.append(course_id)
+    return enroll_sid, enroll_cid
+
+@contextmanager
+def publish(path):
+    """Open a binary file that replaces *path* only once fully written.
+
+    Data goes to a temporary file next to *path* which is then renamed over
+    it, so a reader never sees a half-written CSV.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+            yield file
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+def publish_bytes(path, *chunks):
+    """Replace *path* with the concatenation of *chunks*, like publish().
+
+    The payload is already built, so it bypasses file objects altogether and
+    goes out in a single writev() (or write() per chunk where writev is not
+    available) on a raw descriptor.
+    """
+    tmp_path = path + '.tmp'
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            write_all(fd, chunks)
+        finally:
+            os.close(fd)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+def write_all(fd, chunks):
+    """Write every chunk to *fd*, retrying after short writes."""
+    if hasattr(os, 'writev'):
+        written = os.writev(fd, chunks)
+        if written == sum(map(len, chunks)):
+            return
+        chunks = [b"".join(chunks)[written:]]  # Rare: finish with plain writes
+    for chunk in chunks:
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(fd, view):]
+
+def publish_bytes_uring(files):
+    """publish_bytes() for several (path, payload) pairs through io_uring.
+
+    The temp files are registered with a single ring and all writes are
+    submitted with one io_uring_enter() call. Raises OSError if the kernel
+    does not allow io_uring.
+    """
+    ring = liburing.Ring()
+    liburing.io_uring_queue_init(len(files), ring)
+    tmp_paths = [path + '.tmp' for path, _ in files]
+    fds = []
+    try:
+        for tmp_path in tmp_paths:
+            fds.append(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+        registered = liburing.FileIndex(fds)  # Must stay alive until the writes complete
+        liburing.io_uring_register_files(ring, registered)
+        for index, (_, payload) in enumerate(files):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, index, payload, 0)
+            liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_FIXED_FILE)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+        liburing.io_uring_submit_and_wait(ring, len(files))
+
+        cqe = liburing.Cqe()
+        for _ in files:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            index, result = liburing.io_uring_cqe_get_data64(entry), entry.res
+            liburing.io_uring_cqe_seen(ring, entry)
+            written = liburing.trap_error(result)
+            payload = files[index][1]
+            if written < len(payload):  # Short write: finish it synchronously
+                os.lseek(fds[index], written, os.SEEK_SET)
+                write_all(fds[index], [payload[written:]])
+    except BaseException:
+        for tmp_path in tmp_paths:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_path)
+        raise
+    finally:
+        for fd in fds:
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
+    for (path, _), tmp_path in zip(files, tmp_paths):
+        os.replace(tmp_path, path)
+
+def write_courses():
+    """Save courses to CSV."""
+    publish_bytes('data/courses.csv', COURSES_CSV)
+
+def write_students():
+    """Save students to CSV."""
+    publish_bytes('data/students.csv', STUDENTS_CSV)
+
+def write_tables_uring():
+    """Save courses and students to CSV in a single io_uring submission."""
+    try:
+        publish_bytes_uring([('data/courses.csv', COURSES_CSV), ('data/students.csv', STUDENTS_CSV)])
+    except OSError:
+        # io_uring disabled or refused (e.g. by a container's seccomp policy)
+        write_courses()
+        write_students()
+
+def enrollment_chunks():
+    """Yield the generated enrollments as encoded CSV lines, a batch at a time.
+
+    Rows are formatted and encoded per batch, so the text of the whole file
+    never has to be held at once.
+    """
+    for start in range(0, len(enroll_sid), ENROLLMENT_BATCH_SIZE):
+        sids = enroll_sid[start:start + ENROLLMENT_BATCH_SIZE]
+        cids = enroll_cid[start:start + ENROLLMENT_BATCH_SIZE]
+        if np is not None:
+            # Build the rows with NumPy's vectorized string ops; about twice
+            # as fast as joining the columns as Python strings.
+            lines = "\n".join(np.char.add(np.char.add(sids, ","), cids).tolist())
+        else:
+            # map/join keep the per-row loop in C; this measured faster than
+            # both an f-string generator and "%s,%s".__mod__.
+            lines = "\n".join(map(",".join, zip(sids, cids)))
+        yield (lines + "\n").encode('utf-8')
+
+def write_enrollments():
+    """Save enrollments to CSV."""
+    with publish('data/enrollments.csv') as file:
+        file.write(b"student_id,course_id\n")
+        for chunk in enrollment_chunks():
+            file.write(chunk)
+
+def write_archive():
+    """Save all three CSVs into data/data.tar.gz."""
+    members = [
+        ('courses.csv', COURSES_CSV),
+        ('students.csv', STUDENTS_CSV),
+        ('enrollments.csv', b"student_id,course_id\n" + b"".join(enrollment_chunks())),
+    ]
+    with publish('data/data.tar.gz') as file, tarfile.open(fileobj=file, mode='w:gz') as archive:
+        for name, payload in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(payload)
+            info.mtime = int(time.time())
+            archive.addfile(info, io.BytesIO(payload))
+
+# Sample on the main thread, before any writer threads start: Numba's TBB
+# threading layer hangs at exit if its first parallel launch comes from a
+# worker thread.
+enroll_sid, enroll_cid = generate_enrollments()
+
+if args.archive:
+    # One compressed file instead of three: smaller on disk and fewer
+    # directory entries, for consumers that can read the archive.
+    write_archive()
+    saved_to = "data/data.tar.gz"
+else:
+    # The three files are independent, so write them concurrently; the GIL is
+    # released while each thread waits on its write. With io_uring the two
+    # static tables share one submission instead of a thread each.
+    if liburing is not None:
+        writers = (write_tables_uring, write_enrollments)
+    else:
+        writers = (write_courses, write_students, write_enrollments)
+    with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+        futures = [executor.submit(write) for write in writers]
+        for future in futures:
+            future.result()  # Re-raise any error from the worker thread
+    saved_to = "data/courses.csv, data/students.csv, and data/enrollments.csv"
+
+print(f"Generated {len(courses)} courses, {len(students)} students, and {len(enroll_sid)} enrollments.")
+print(f"Data saved to {saved_to}")
@@ -1,30 +1,65 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import atexit
 import csv
 import os
 import datetime
+from functools import lru_cache
+
+np = None  # NumPy is imported by import_numpy() only for conflict queries
+pd = None  # pandas is imported by import_pandas() only for large data sets
+
+# Below this many bytes of CSV data, importing pandas costs more than its
+# parser saves; building the Student/Course objects dominates either way.
+_PANDAS_MIN_BYTES = 64 << 20
+
+def import_pandas():
+    """Import pandas on first use; return False if it isn't installed."""
+    global pd
+    if pd is None:
+        try:
+            import pandas
+        except ImportError:  # pandas is optional; fall back to the csv module
+            return False
+        pd = pandas
+    return True
+
+def import_numpy():
+    """Import NumPy on first use; return False if it isn't installed."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # NumPy is optional; conflict queries fall back to a loop
+            return False
+        np = numpy
+    return True
 
 # --------------------------
 # Helper Functions for Time
 # --------------------------
+@lru_cache(maxsize=1024)
 def time_to_minutes(time_str):
     """Converts 'HH:MM' to total minutes from midnight."""
     hours, minutes = map(int, time_str.split(":"))
     return hours * 60 + minutes
 
-def is_time_conflict(schedule1, schedule2):
+# Allowed hours for a course: weekdays only, between 8:00 and 17:50.
+_ALLOWED_DAYS = frozenset(('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday'))
+_MIN_START = 8 * 60
+_MAX_END = 17 * 60 + 50
+_DAY_INDEX = {'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3, 'Friday': 4}
+_DAY_SLOTS = 600  # One bit per minute from 8:00 to 18:00 in a schedule bitmap
+
+def is_time_conflict(course1, course2):
     """
-    Checks if two schedules conflict.
-    Each schedule is a tuple: (day, start_time, end_time)
+    Checks if two courses' schedules conflict.
+    Uses the day and start/end minutes cached on each Course.
     Conflict exists if days are equal and time intervals overlap.
     """
-    day1, start1, end1 = schedule1
-    day2, start2, end2 = schedule2
-    if day1 != day2:
-        return False
-    s1, e1 = time_to_minutes(start1), time_to_minutes(end1)
-    s2, e2 = time_to_minutes(start2), time_to_minutes(end2)
-    return s1 < e2 and s2 < e1
+    return (course1.day == course2.day
+            and course1.start_min < course2.end_min
+            and course2.start_min < course1.end_min)
 
 def is_within_allowed_time(schedule):
     """
@@ -33,14 +68,21 @@ def is_within_allowed_time(schedule):
     """
     day, start, end = schedule
     # Allowed days: Monday to Friday
-    if day not in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']:
+    if day not in _ALLOWED_DAYS:
         return False
-    start_minutes = time_to_minutes(start)
-    end_minutes = time_to_minutes(end)
-    if start_minutes < time_to_minutes("08:00") or end_minutes > time_to_minutes("17:50"):
+    if time_to_minutes(start) < _MIN_START or time_to_minutes(end) > _MAX_END:
         return False
     return True
 
+def schedule_error(course_id, schedule):
+    """Message for a course whose schedule fails is_within_allowed_time."""
+    return f"Course {course_id} schedule {schedule} is out of allowed hours or occurs on a weekend."
+
+def minutes_column(times):
+    """Vectorized time_to_minutes over a pandas Series of 'HH:MM' strings (NaN if unparseable)."""
+    parts = times.str.partition(':')
+    return pd.to_numeric(parts[0], errors='coerce') * 60 + pd.to_numeric(parts[2], errors='coerce')
+
 # --------------------------
 # Data Model Classes
 # --------------------------
@@ -48,8 +90,10 @@ class Student:
     def __init__(self, student_id, name):
         self.student_id = student_id
         self.name = name
-        # Store course IDs that the student is enrolled in.
-        self.registered_courses = set()
+        # Bit i is set when the student is enrolled in the course with index i.
+        self.registered_mask = 0
+        # Union of the time bitmaps of the registered courses.
+        self.schedule_mask = 0
 
 class Course:
     def __init__(self, course_id, name, instructor, schedule, max_students=30, credits=3):
@@ -57,12 +101,24 @@ class Course:
         self.name = name
         self.instructor = instructor
         self.schedule = schedule  # Tuple: (day, start, end)
-        self.enrolled_students = set()
+        # Parsed once so conflict checks are plain integer comparisons.
+        self.day = schedule[0]
+        self.start_min = time_to_minutes(schedule[1])
+        self.end_min = time_to_minutes(schedule[2])
+        # Fixed part of the course's listbox line; only the enrollment count changes.
+        self._display_prefix = f"{course_id}: {name} ({schedule[0]} {schedule[1]}-{schedule[2]})"
+        # Row written by save_courses; schedules don't change after construction.
+        self._csv_row = (course_id, name, instructor, schedule[0], f"{schedule[1]}-{schedule[2]}")
+        self.enrolled_students = set()  # Indices of the enrolled students
         self.max_students = max_students
         self.credits = credits
         
         if not is_within_allowed_time(schedule):
-            raise ValueError(f"Course {course_id} schedule {schedule} is out of allowed hours or occurs on a weekend on a weekend.")
+            raise ValueError(schedule_error(course_id, schedule))
+        self.day_idx = _DAY_INDEX[self.day]
+        # One bit per minute the course meets; overlapping courses share a bit.
+        self.time_bitmap = (((1 << max(self.end_min - self.start_min, 0)) - 1)
+                            << (self.day_idx * _DAY_SLOTS + self.start_min - _MIN_START))
 
 class EnrollmentSystem:
     def __init__(self):
@@ -71,8 +127,7 @@ class EnrollmentSystem:
         self.courses = {}   # key: course_id, value: Course object
         
         # Create data directory if it doesn't exist
-        if not os.path.exists('data'):
-            os.makedirs('data')
+        os.makedirs('data', exist_ok=True)
         
         # Load data from CSV files
         self.load_data()
@@ -80,86 +135,261 @@ class EnrollmentSystem:
         # If no courses exist, create hypothetical courses
         if not self.courses:
             self.courses = create_hypothetical_courses()
+            self.build_indexes()
             self.save_courses()
+        
+        # Enrollments are appended to this handle; drops rewrite the file.
+        self._enroll_fp = None
+        self._enroll_writer = None
+        self.open_enrollment_log()
+        
+        # Changes are written out by flush_enrollments rather than on every action.
+        self._enroll_dirty = False
+        self._enroll_rewrite = False
+        # Scripts that never call close() still get their changes written out.
+        atexit.register(self.close)
     
     def load_data(self):
         """Load student and course data from CSV files."""
-        # Load students
+        data_size = sum(os.path.getsize(f'data/{name}.csv') for name in ('students', 'courses', 'enrollments')
+                        if os.path.exists(f'data/{name}.csv'))
+        use_pandas = data_size >= _PANDAS_MIN_BYTES and import_pandas()
+        
+        # Each pandas loader returns False if the file needs the csv module instead
         if os.path.exists('data/students.csv'):
-            with open('data/students.csv', 'r', newline='') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    if len(row) >= 2:
-                        student_id, name = row[0], row[1]
-                        self.students[student_id] = Student(student_id, name)
-        
-        # Load courses
+            if not (use_pandas and self.load_students_pandas()):
+                self.load_students_csv()
         if os.path.exists('data/courses.csv'):
-            with open('data/courses.csv', 'r', newline='') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    if len(row) >= 5:
-                        course_id, name, instructor, day, time = row[0], row[1], row[2], row[3], row[4]
-                        start_time, end_time = time.split('-')
-                        schedule = (day, start_time, end_time)
-                        try:
-                            self.courses[course_id] = Course(course_id, name, instructor, schedule)
-                        except ValueError as e:
-                            print(f"Error loading course {course_id}: {e}")
-        
-        # Load enrollments
+            if not (use_pandas and self.load_courses_pandas()):
+                self.load_courses_csv()
+        self.build_indexes()
         if os.path.exists('data/enrollments.csv'):
-            with open('data/enrollments.csv', 'r', newline='') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    if len(row) >= 2:
-                        student_id, course_id = row[0], row[1]
-                        if student_id in self.students and course_id in self.courses:
-                            student = self.students[student_id]
-                            course = self.courses[course_id]
-                            student.registered_courses.add(course_id)
-                            course.enrolled_students.add(student_id)
+            if not (use_pandas and self.load_enrollments_pandas()):
+                self.load_enrollments_csv()
+    
+    def build_indexes(self):
+        """Assign each course and student a small integer index in load order."""
+        self._courses_by_idx = list(self.courses.values())
+        self._course_index = {course_id: i for i, course_id in enumerate(self.courses)}
+        self._students_by_idx = list(self.students.values())
+        self._student_index = {student_id: i for i, student_id in enumerate(self.students)}
+        # (days, starts, ends) arrays, built by get_conflicting_courses on first use
+        self._schedule_columns = None
+    
+    def courses_in_mask(self, mask):
+        """Return the courses whose bits are set in a registration mask."""
+        # Walk only the set bits; a student has a handful of courses, the catalog may have thousands
+        courses = []
+        while mask:
+            low = mask & -mask
+            courses.append(self._courses_by_idx[low.bit_length() - 1])
+            mask ^= low
+        return courses
+    
+    def load_students_csv(self):
+        """Load student data row by row with the csv module."""
+        with open('data/students.csv', 'r', newline='', buffering=1 << 20) as file:
+            reader = csv.reader(file)
+            next(reader)  # Skip header
+            self.students = {row[0]: Student(row[0], row[1]) for row in reader if len(row) >= 2}
+    
+    def load_courses_csv(self):
+        """Load course data row by row with the csv module."""
+        with open('data/courses.csv', 'r', newline='', buffering=1 << 20) as file:
+            reader = csv.reader(file)
+            next(reader)  # Skip header
+            for row in reader:
+                if len(row) >= 5:
+                    course_id, name, instructor, day, time = row[0], row[1], row[2], row[3], row[4]
+                    start_time, end_time = time.split('-')
+                    schedule = (day, start_time, end_time)
+                    try:
+                        self.courses[course_id] = Course(course_id, name, instructor, schedule)
+                    except ValueError as e:
+                        print(f"Error loading course {course_id}: {e}")
+    
+    def load_enrollments_csv(self):
+        """Load enrollment data row by row with the csv module."""
+        with open('data/enrollments.csv', 'r', newline='', buffering=1 << 20) as file:
+            reader = csv.reader(file)
+            next(reader)  # Skip header
+            self.add_loaded_enrollments((row[0], row[1]) for row in reader if len(row) >= 2)
+    
+    def add_loaded_enrollments(self, pairs):
+        """Record (student_id, course_id) pairs read from disk, skipping unknown IDs."""
+        students, courses = self.students, self.courses
+        course_index, student_index = self._course_index, self._student_index
+        for student_id, course_id in pairs:
+            if student_id in students and course_id in courses:
+                student, course = students[student_id], courses[course_id]
+                student.registered_mask |= 1 << course_index[course_id]
+                student.schedule_mask |= course.time_bitmap
+                course.enrolled_students.add(student_index[student_id])
+    
+    def read_csv_pandas(self, path, names):
+        """
+        Read the leading columns of a CSV file with pandas' C parser.
+        Returns None if any of those fields is empty: the C parser fills the
+        fields of a short row with '' too, so only the csv module can tell
+        which rows to skip.
+        """
+        frame = pd.read_csv(path, usecols=range(len(names)), names=names, header=0,
+                            dtype=str, keep_default_na=False)
+        if (frame == '').to_numpy().any():
+            return None
+        return frame
+    
+    def load_students_pandas(self):
+        """Load student data with pandas; return False to fall back to csv."""
+        students = self.read_csv_pandas('data/students.csv', ['student_id', 'name'])
+        if students is None:
+            return False
+        self.students = {student_id: Student(student_id, name)
+                         for student_id, name in zip(students['student_id'].tolist(), students['name'].tolist())}
+        return True
+    
+    def load_courses_pandas(self):
+        """Load course data with pandas; return False to fall back to csv."""
+        courses = self.read_csv_pandas('data/courses.csv', ['course_id', 'name', 'instructor', 'day', 'time'])
+        if courses is None:
+            return False
+        times = courses['time'].str.partition('-')
+        courses['start'], courses['end'] = times[0], times[2]
+        # Validate every schedule in one vectorized pass
+        ok = (courses['day'].isin(_ALLOWED_DAYS).values
+              & (minutes_column(courses['start']).values >= _MIN_START)
+              & (minutes_column(courses['end']).values <= _MAX_END))
+        for row in courses[ok].itertuples(index=False):
+            # The mask is lenient about number formats, so Course can still reject a row
+            try:
+                self.courses[row.course_id] = Course(row.course_id, row.name, row.instructor, (row.day, row.start, row.end))
+            except ValueError as e:
+                print(f"Error loading course {row.course_id}: {e}")
+        for row in courses[~ok].itertuples(index=False):
+            schedule = (row.day, row.start, row.end)
+            print(f"Error loading course {row.course_id}: {schedule_error(row.course_id, schedule)}")
+        return True
+    
+    def load_enrollments_pandas(self):
+        """Load enrollment data with pandas; return False to fall back to csv."""
+        enrollments = self.read_csv_pandas('data/enrollments.csv', ['student_id', 'course_id'])
+        if enrollments is None:
+            return False
+        # Plain lists iterate far faster than per-group pandas objects
+        self.add_loaded_enrollments(zip(enrollments['student_id'].tolist(), enrollments['course_id'].tolist()))
+        return True
+    
+    def schedule_mask_for(self, mask):
+        """Return the union of the time bitmaps of the courses in a registration mask."""
+        schedule_mask = 0
+        for course in self.courses_in_mask(mask):
+            schedule_mask |= course.time_bitmap
+        return schedule_mask
+    
+    def find_conflict(self, student, course):
+        """Return the registered course that overlaps the given course, or None."""
+        if not student.schedule_mask & course.time_bitmap:
+            return None
+        # Only on a conflict: find which course it is, for the error message
+        for other in self.courses_in_mask(student.registered_mask):
+            if other.time_bitmap & course.time_bitmap:
+                return other
     
     def save_data(self):
         """Save all data to CSV files."""
         self.save_students()
         self.save_courses()
-        self.save_enrollments()
+        self.rewrite_enrollments()
     
     def save_students(self):
         """Save student data to CSV file."""
         with open('data/students.csv', 'w', newline='') as file:
             writer = csv.writer(file)
             writer.writerow(['student_id', 'name'])
-            for student in self.students.values():
-                writer.writerow([student.student_id, student.name])
+            writer.writerows((student.student_id, student.name) for student in self.students.values())
     
     def save_courses(self):
         """Save course data to CSV file."""
         with open('data/courses.csv', 'w', newline='') as file:
             writer = csv.writer(file)
             writer.writerow(['course_id', 'name', 'instructor', 'day', 'time'])
-            for course in self.courses.values():
-                day, start, end = course.schedule
-                writer.writerow([course.course_id, course.name, course.instructor, day, f"{start}-{end}"])
+            writer.writerows(course._csv_row for course in self.courses.values())
+    
+    def open_enrollment_log(self):
+        """Open enrollments.csv for appending, writing the header if the file is new."""
+        first_line = last_byte = b''
+        if os.path.exists('data/enrollments.csv') and os.path.getsize('data/enrollments.csv'):
+            with open('data/enrollments.csv', 'rb') as file:
+                first_line = file.readline()
+                file.seek(-1, os.SEEK_END)
+                last_byte = file.read()
+        # Match an existing file's line endings; rewrites always use '\n'
+        lineterminator = '\r\n' if first_line.endswith(b'\r\n') else '\n'
+        self._enroll_fp = open('data/enrollments.csv', 'a', newline='', buffering=1 << 16)
+        self._enroll_writer = csv.writer(self._enroll_fp, lineterminator=lineterminator)
+        if not first_line:
+            self._enroll_writer.writerow(['student_id', 'course_id'])
+            self._enroll_fp.flush()
+        elif last_byte != b'\n':
+            # Hand-edited files may lack a final newline; end the last row first
+            self._enroll_fp.write(lineterminator)
+            self._enroll_fp.flush()
     
-    def save_enrollments(self):
-        """Save enrollment data to CSV file."""
+    def ensure_enrollment_log(self):
+        """Reopen the append handle after close(), re-arming the exit hook."""
+        if self._enroll_fp is None:
+            self.open_enrollment_log()
+            atexit.register(self.close)
+    
+    def append_enrollment(self, student_id, course_id):
+        """Buffer a single enrollment row for the CSV file."""
+        self.ensure_enrollment_log()
+        self._enroll_writer.writerow([student_id, course_id])
+        self._enroll_dirty = True
+    
+    def flush_enrollments(self):
+        """Write out pending enrollment changes, if any."""
+        if self._enroll_rewrite:
+            self.rewrite_enrollments()
+        elif self._enroll_dirty:
+            self._enroll_fp.flush()
+            self._enroll_dirty = False
+    
+    def rewrite_enrollments(self):
+        """Rewrite the full enrollment CSV file (used for drops and full saves)."""
+        self.close_enrollment_log()
         with open('data/enrollments.csv', 'w', newline='') as file:
-            writer = csv.writer(file)
+            writer = csv.writer(file, lineterminator='\n')
             writer.writerow(['student_id', 'course_id'])
-            for student in self.students.values():
-                for course_id in student.registered_courses:
-                    writer.writerow([student.student_id, course_id])
+            writer.writerows((student.student_id, course.course_id)
+                             for student in self.students.values()
+                             for course in self.courses_in_mask(student.registered_mask))
+        self.open_enrollment_log()
+        self._enroll_dirty = False
+        self._enroll_rewrite = False
+    
+    def close_enrollment_log(self):
+        """Close the enrollment append handle."""
+        if self._enroll_fp is not None:
+            self._enroll_fp.close()
+            self._enroll_fp = None
+            self._enroll_writer = None
+    
+    def close(self):
+        """Write out pending enrollment changes and close the append handle."""
+        self.flush_enrollments()
+        self.close_enrollment_log()
+        # Nothing left for the exit hook to do, and it would keep this object alive
+        atexit.unregister(self.close)
     
     def add_student(self, student_id, name):
         """Add a new student to the system."""
         if student_id in self.students:
             raise ValueError("Student ID already exists.")
-        self.students[student_id] = Student(student_id, name)
+        student = Student(student_id, name)
+        self.students[student_id] = student
+        self._student_index[student_id] = len(self._students_by_idx)
+        self._students_by_idx.append(student)
         self.save_students()
     
     def enroll_student(self, student_id, course_id):
@@ -172,9 +402,10 @@ class EnrollmentSystem:
         
         student = self.students[student_id]
         course = self.courses[course_id]
+        course_bit = 1 << self._course_index[course_id]
         
         # Check if already enrolled.
-        if course_id in student.registered_courses:
+        if student.registered_mask & course_bit:
             raise ValueError("Student is already enrolled in this course.")
         
         # Check course capacity.
@@ -182,47 +413,71 @@ class EnrollmentSystem:
             raise ValueError("Course is already full.")
         
         # Check scheduling conflicts with already registered courses.
-        for cid in student.registered_courses:
-            other_course = self.courses[cid]
-            if is_time_conflict(course.schedule, other_course.schedule):
-                raise ValueError(f"Scheduling conflict with {other_course.course_id} ({other_course.name}).")
+        other_course = self.find_conflict(student, course)
+        if other_course is not None:
+            raise ValueError(f"Scheduling conflict with {other_course.course_id} ({other_course.name}).")
         
         # Check credit limit: maximum 6 courses (6 x 3 = 18 credits)
-        if len(student.registered_courses) >= 6:
+        if bin(student.registered_mask).count("1") >= 6:
             raise ValueError("Enrolling in this course would exceed the maximum allowed credits (18).")
         
         # Enroll the student.
-        student.registered_courses.add(course_id)
-        course.enrolled_students.add(student_id)
-        self.save_enrollments()
+        student.registered_mask |= course_bit
+        course.enrolled_students.add(self._student_index[student_id])
+        student.schedule_mask |= course.time_bitmap
+        self.append_enrollment(student_id, course_id)
     
     def drop_course(self, student_id, course_id):
         """Drop a student from a course."""
         if student_id not in self.students:
             raise ValueError("Student does not exist.")
         student = self.students[student_id]
-        if course_id not in student.registered_courses:
+        course_bit = 1 << self._course_index[course_id] if course_id in self._course_index else 0
+        if not student.registered_mask & course_bit:
             raise ValueError("Student is not enrolled in the specified course.")
         
         # Check credit limit: dropping would leave fewer than 3 courses (9 credits).
-        if len(student.registered_courses) <= 3:
+        if bin(student.registered_mask).count("1") <= 3:
             raise ValueError("Dropping this course would result in fewer than the minimum required credits (9).")
         
         # Proceed to drop.
-        student.registered_courses.remove(course_id)
+        student.registered_mask &= ~course_bit
         course = self.courses[course_id]
-        course.enrolled_students.remove(student_id)
-        self.save_enrollments()
+        course.enrolled_students.remove(self._student_index[student_id])
+        # Rebuilt from the remaining courses rather than cleared bit-wise, since
+        # loaded data may hold overlapping courses
+        student.schedule_mask = self.schedule_mask_for(student.registered_mask)
+        # CSV has no in-place delete, so the next flush rewrites the file.
+        self.ensure_enrollment_log()
+        self._enroll_rewrite = True
     
     def get_student_courses(self, student_id):
         """Get all courses a student is enrolled in."""
         if student_id not in self.students:
             raise ValueError("Student does not exist.")
-        return [self.courses[cid] for cid in self.students[student_id].registered_courses]
+        return self.courses_in_mask(self.students[student_id].registered_mask)
     
     def get_available_courses(self):
         """Get all available courses."""
         return list(self.courses.values())
+    
+    def get_conflicting_courses(self, course_id):
+        """Get all other courses whose schedule overlaps the given course."""
+        if course_id not in self.courses:
+            raise ValueError("Course does not exist.")
+        i = self._course_index[course_id]
+        if not import_numpy():
+            course = self._courses_by_idx[i]
+            return [other for j, other in enumerate(self._courses_by_idx) if j != i and is_time_conflict(course, other)]
+        if self._schedule_columns is None:
+            courses = self._courses_by_idx
+            self._schedule_columns = (np.array([c.day_idx for c in courses], dtype=np.int8),
+                                      np.array([c.start_min for c in courses], dtype=np.int16),
+                                      np.array([c.end_min for c in courses], dtype=np.int16))
+        days, starts, ends = self._schedule_columns
+        conflicts = (days == days[i]) & (starts < ends[i]) & (starts[i] < ends)
+        conflicts[i] = False
+        return [self._courses_by_idx[j] for j in np.flatnonzero(conflicts)]
 
 def create_hypothetical_courses():
     """
@@ -254,6 +509,9 @@ class RegistrationApp:
         self.root.title("University Course Registration System")
         self.system = enrollment_system
         self.current_student_id = None
+        # Course IDs of the listbox rows, kept in step with update_course_lists
+        self._available_course_ids = []
+        self._registered_course_ids = []
         
         # Configure the root window to be responsive
         self.root.geometry("800x600")
@@ -278,14 +536,32 @@ class RegistrationApp:
             frame.grid_rowconfigure(0, weight=1)
             frame.grid_columnconfigure(0, weight=1)
         
-        # Initialize UI components
+        # Initialize UI components; the registration and course screens
+        # are built the first time they are shown.
         self.setup_welcome_screen()
         self.setup_login_screen()
-        self.setup_registration_screen()
-        self.setup_course_screen()
+        self._registration_built = False
+        self._course_built = False
         
         # Show welcome screen initially
         self.show_welcome_screen()
+        
+        # Write out enrollment changes periodically and when the window closes
+        self.root.after(500, self._flush_tick)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+    
+    def _flush_tick(self):
+        """Flush pending enrollment changes and reschedule."""
+        # Reschedule even if a flush fails, so one I/O error doesn't stop saving
+        try:
+            self.system.flush_enrollments()
+        finally:
+            self.root.after(500, self._flush_tick)
+    
+    def _on_close(self):
+        """Flush pending enrollment changes and close the window."""
+        self.system.close()
+        self.root.destroy()
     
     def setup_welcome_screen(self):
         """Setup the welcome screen with a welcome message and login button"""
@@ -525,6 +801,10 @@ class RegistrationApp:
     
     def show_registration_screen(self):
         """Show the registration screen and hide others"""
+        if not self._registration_built:
+            self.setup_registration_screen()
+            self._registration_built = True
+        
         self.welcome_frame.grid_remove()
         self.login_frame.grid_remove()
         self.registration_frame.grid(row=0, column=0, sticky="nsew")
@@ -535,6 +815,10 @@ class RegistrationApp:
     
     def show_course_screen(self):
         """Show the course screen and hide others"""
+        if not self._course_built:
+            self.setup_course_screen()
+            self._course_built = True
+        
         self.welcome_frame.grid_remove()
         self.login_frame.grid_remove()
         self.registration_frame.grid_remove()
@@ -582,14 +866,12 @@ class RegistrationApp:
             self.login_status.config(text="Student ID already exists. Please login instead.")
             return
         
-        # Pre-fill registration form
+        # Show registration screen (building it if needed), then pre-fill the form
+        self.show_registration_screen()
         self.reg_student_id_entry.delete(0, tk.END)
         self.reg_student_id_entry.insert(0, student_id)
         self.reg_name_entry.delete(0, tk.END)
         self.reg_name_entry.insert(0, name)
-        
-        # Show registration screen
-        self.show_registration_screen()
     
     def complete_registration(self):
         """Complete the registration process"""
@@ -614,21 +896,30 @@ class RegistrationApp:
     
     def update_course_lists(self):
         """Update the available and registered course lists"""
+        # Build both lists' lines first so the listboxes are mutated back to back
+        courses = self.system.get_available_courses()
+        available_lines = [
+            f"{course._display_prefix} | Enrolled: {len(course.enrolled_students)}/{course.max_students}"
+            for course in courses
+        ]
+        try:
+            student_courses = self.system.get_student_courses(self.current_student_id)
+        except ValueError as e:
+            student_courses = []
+            self.course_status.config(text=str(e))
+        
         # Update available courses listbox
+        self._available_course_ids = [course.course_id for course in courses]
         self.available_listbox.delete(0, tk.END)
-        for course in self.system.get_available_courses():
-            info = f"{course.course_id}: {course.name} ({course.schedule[0]} {course.schedule[1]}-{course.schedule[2]}) | Enrolled: {len(course.enrolled_students)}/{course.max_students}"
-            self.available_listbox.insert(tk.END, info)
+        self.available_listbox.insert(tk.END, *available_lines)
         
         # Update registered courses listbox
+        self._registered_course_ids = [course.course_id for course in student_courses]
         self.registered_listbox.delete(0, tk.END)
-        try:
-            student_courses = self.system.get_student_courses(self.current_student_id)
-            for course in student_courses:
-                info = f"{course.course_id}: {course.name} ({course.schedule[0]} {course.schedule[1]}-{course.schedule[2]})"
-                self.registered_listbox.insert(tk.END, info)
-        except ValueError as e:
-            self.course_status.config(text=str(e))
+        self.registered_listbox.insert(tk.END, *[course._display_prefix for course in student_courses])
+        
+        # Repaint both listboxes in one pass
+        self.course_frame.update_idletasks()
     
     def enroll_course(self):
         """Handle course enrollment"""
@@ -637,9 +928,7 @@ class RegistrationApp:
             self.course_status.config(text="Please select a course to enroll.")
             return
         
-        # Extract course_id from the selected line
-        course_line = self.available_listbox.get(selection[0])
-        course_id = course_line.split(":")[0]
+        course_id = self._available_course_ids[selection[0]]
         
         try:
             self.system.enroll_student(self.current_student_id, course_id)
@@ -655,8 +944,7 @@ class RegistrationApp:
             self.course_status.config(text="Please select a course to drop.")
             return
         
-        course_line = self.registered_listbox.get(selection[0])
-        course_id = course_line.split(":")[0]
+        course_id = self._registered_course_ids[selection[0]]
         
         try:
             self.system.drop_course(self.current_student_id, course_id)
@@ -683,4 +971,5 @@ if __name__ == "__main__":
     app = RegistrationApp(root, enrollment_system)
     
     # Start the main loop
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+    enrollment_system.close()
\ No newline at end of file